@@ -3,20 +3,24 @@
 
 import argparse
 import asyncio
+import functools
 import logging
 import sys
+from collections.abc import Iterable
+from contextlib import suppress
+from datetime import timedelta
 from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional
 
 from dotenv import load_dotenv
-from telegram import Bot
-from telegram.error import TelegramError
 
 from src.config import (
     get_bot_token,
     get_chat_id,
     get_config_path,
+    get_current_iso_year,
     get_force_week,
-    get_schedule_path,
     get_test_message,
     load_config,
 )
@@ -27,6 +31,10 @@ from src.rotation import (
     load_schedule_data,
 )
 
+if TYPE_CHECKING:
+    from telegram import Bot
+    from telegram.error import RetryAfter
+
 # Load .env file if it exists
 env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
@@ -39,46 +47,254 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Telegram rejects message texts longer than this
+MAX_MESSAGE_LENGTH = 4096
+
+# Retry policy for flood control and transient network errors
+MAX_SEND_ATTEMPTS = 3
+NETWORK_BACKOFF_SECONDS = 0.5
+# Give up rather than park the job when Telegram asks for a longer wait
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bot(token: str) -> "Bot":
+    """
+    Get a Bot for the token, reusing the instance across calls.
+
+    Callers enter ``async with bot.request:`` for each run so the HTTP
+    connection pool is opened on, and closed with, the current event loop.
+    Bot.initialize() is deliberately skipped: it only adds a getMe round trip.
+    """
+    # Imported lazily so dry runs never load the telegram/httpx stack
+    from telegram import Bot
+
+    return Bot(token=token)
+
 
 async def send_message(
-    bot: Bot, chat_id: str, message: str, dry_run: bool = False
+    bot: Optional["Bot"], chat_id: str, message: str, dry_run: bool = False
 ) -> bool:
-    """Send message to Telegram chat."""
+    """
+    Send message to Telegram chat.
+
+    Flood-control (RetryAfter) and network errors are retried up to
+    MAX_SEND_ATTEMPTS times, unless Telegram asks to wait longer than
+    MAX_RETRY_AFTER_SECONDS; any other error fails immediately.
+    """
     if dry_run:
         logger.info(f"[DRY RUN] Would send message to {chat_id}:")
         logger.info(f"[DRY RUN] {message}")
         return True
+    if bot is None:
+        raise ValueError("A bot is required unless dry_run is set")
 
-    try:
-        await bot.send_message(chat_id=chat_id, text=message)
-        logger.info(f"Message sent successfully to {chat_id}")
-        return True
-    except (TelegramError, Exception) as e:
-        logger.error(f"Failed to send message: {e}")
-        return False
+    from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
+
+    last_error: TelegramError
+    for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+        try:
+            await bot.send_message(chat_id=chat_id, text=message)
+            logger.info(f"Message sent successfully to {chat_id}")
+            return True
+        except RetryAfter as e:
+            last_error = e
+        except BadRequest as e:
+            # BadRequest subclasses NetworkError but retrying cannot fix it
+            logger.error(f"Telegram rejected message: {e}")
+            return False
+        except NetworkError as e:
+            # Also covers TimedOut
+            last_error = e
+        except TelegramError as e:
+            logger.error(f"Telegram rejected message: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to send message: {e}")
+            return False
+
+        if attempt == MAX_SEND_ATTEMPTS:
+            break
+
+        if isinstance(last_error, RetryAfter):
+            delay = _retry_after_seconds(last_error)
+            if delay > MAX_RETRY_AFTER_SECONDS:
+                logger.error(
+                    f"Flood control wait of {delay}s exceeds "
+                    f"{MAX_RETRY_AFTER_SECONDS}s, giving up: {last_error}"
+                )
+                return False
+            logger.warning(f"Flood control exceeded, retry in {delay}s: {last_error}")
+        else:
+            delay = NETWORK_BACKOFF_SECONDS * 2 ** (attempt - 1)
+            logger.warning(f"Network error, retry in {delay}s: {last_error}")
+        await asyncio.sleep(delay)
+
+    logger.error(
+        f"Failed to send message after {MAX_SEND_ATTEMPTS} attempts: {last_error}"
+    )
+    return False
+
+
+def _retry_after_seconds(error: "RetryAfter") -> float:
+    """Read RetryAfter's delay, which may be an int or a timedelta."""
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+def pack_lines(lines: Iterable[str], max_len: int = MAX_MESSAGE_LENGTH) -> list[str]:
+    """
+    Greedily join lines with newlines into chunks of at most max_len characters.
+
+    A single line longer than max_len is split across several chunks.
+    """
+    if max_len < 1:
+        raise ValueError(f"max_len must be at least 1, got {max_len}")
+
+    chunks: list[str] = []
+    current: list[str] = []
+    current_len = 0
+
+    for line in lines:
+        if len(line) > max_len:
+            if current:
+                chunks.append("\n".join(current))
+                current, current_len = [], 0
+            while len(line) > max_len:
+                chunks.append(line[:max_len])
+                line = line[max_len:]
+        # Joining adds one newline per line after the first
+        added_len = len(line) + (1 if current else 0)
+        if current and current_len + added_len > max_len:
+            chunks.append("\n".join(current))
+            current, current_len = [], 0
+            added_len = len(line)
+        current.append(line)
+        current_len += added_len
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+async def send_messages(
+    bot: Optional["Bot"],
+    chat_id: str,
+    lines: Iterable[str],
+    max_len: int = MAX_MESSAGE_LENGTH,
+    dry_run: bool = False,
+) -> bool:
+    """Send lines to Telegram chat, packed into as few messages as possible."""
+    success = True
+    for chunk in pack_lines(lines, max_len):
+        if not await send_message(bot, chat_id, chunk, dry_run):
+            success = False
+    return success
+
+
+class RateLimitedSender:
+    """
+    Queue outgoing messages and deliver them within Telegram's rate limit.
+
+    A background worker drains the queue and starts at most ``rate`` sends in
+    any ``period``-second window; sends within that budget run concurrently.
+    """
+
+    def __init__(self, bot: "Bot", rate: int = 30, period: float = 1.0) -> None:
+        self._bot = bot
+        self._period = period
+        self._tokens = asyncio.Semaphore(rate)
+        self._queue: asyncio.Queue[tuple[str, str, asyncio.Future[bool]]] = (
+            asyncio.Queue()
+        )
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._deliveries: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> "RateLimitedSender":
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the background worker."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._sender_loop())
+
+    async def send(self, chat_id: str, message: str) -> bool:
+        """Queue a message and wait until it has been delivered."""
+        # Make sure something drains the queue, even before start() or after close()
+        self.start()
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        await self._queue.put((chat_id, message, future))
+        return await future
+
+    async def close(self) -> None:
+        """Wait for queued messages to be delivered, then stop the worker."""
+        await self._queue.join()
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+    async def _sender_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            chat_id, message, future = await self._queue.get()
+            await self._tokens.acquire()
+            # Each token returns to the bucket one period after it was taken
+            loop.call_later(self._period, self._tokens.release)
+            task = asyncio.create_task(self._deliver(chat_id, message, future))
+            self._deliveries.add(task)
+            task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(
+        self, chat_id: str, message: str, future: asyncio.Future[bool]
+    ) -> None:
+        try:
+            success = await send_message(self._bot, chat_id, message)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(success)
+        finally:
+            self._queue.task_done()
 
 
 async def main(args: argparse.Namespace) -> int:
     """Main bot logic."""
     try:
-        # Load configuration
-        config = load_config(get_config_path())
-        schedule_data = load_schedule_data(get_schedule_path())
+        # Load configuration; both loaders share one parse of the data file
+        config_path = get_config_path()
+        config = load_config(config_path)
+        schedule_data = load_schedule_data(config_path)
 
         # Get bot credentials
         if not args.dry_run:
             bot_token = get_bot_token()
             chat_id = get_chat_id()
-            bot = Bot(token=bot_token)
+            bot = _get_bot(bot_token)
         else:
             bot = None
             chat_id = "TEST_CHAT_ID"
 
         # Determine week to use
         if args.test_week:
-            week_string = f"2025-W{args.test_week:02d}"
+            year = get_current_iso_year(config["timezone"])
+            week_string = f"{year}-W{args.test_week:02d}"
             logger.info(f"Using test week: {week_string}")
-        elif force_week := get_force_week():
+        elif force_week := get_force_week(config["timezone"]):
             week_string = force_week
             logger.info(f"Using forced week: {week_string}")
         else:
@@ -106,13 +322,13 @@ async def main(args: argparse.Namespace) -> int:
 
         # Send message
         if bot:
-            success = await send_message(bot, chat_id, message, args.dry_run)
-            return 0 if success else 1
+            # Scope only the HTTP pool to this run's event loop
+            async with bot.request, RateLimitedSender(bot) as sender:
+                success = await sender.send(chat_id, message)
         else:
-            # Dry run - no bot needed
-            logger.info(f"[DRY RUN] Would send message to {chat_id}:")
-            logger.info(f"[DRY RUN] {message}")
-            return 0
+            # Dry run - send_message only logs, no bot needed
+            success = await send_message(bot, chat_id, message, dry_run=True)
+        return 0 if success else 1
 
     except Exception as e:
         logger.error(f"Bot error: {e}")
@@ -1,15 +1,49 @@
 """Configuration management for the bot."""
 
+import functools
 import json
 import os
+from collections.abc import Callable, Mapping
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
 
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
 
-def load_config(config_path: Path) -> dict:
-    """Load bot configuration from JSON file."""
-    with open(config_path, encoding="utf-8") as f:
-        return json.load(f)  # type: ignore[no-any-return]
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Parse the config file; cached per (path, mtime) pair."""
+    return freeze(_json_loads(Path(path_str).read_bytes()))  # type: ignore[no-any-return]
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def load_config(config_path: Path) -> Mapping[str, Any]:
+    """
+    Load bot configuration from JSON file.
+
+    The parsed result is cached until the file's mtime changes and is returned
+    deeply frozen (see freeze) so callers cannot mutate the shared copy: JSON
+    objects become read-only mappings and arrays become tuples.
+    """
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    return _load_config_cached(str(config_path), mtime_ns)
 
 
 def get_bot_token() -> str:
@@ -33,34 +67,54 @@ def get_test_message() -> Optional[str]:
     return os.environ.get("TEST_MESSAGE")
 
 
-def get_force_week() -> Optional[str]:
-    """Get forced week number from environment variable."""
-    force_week = os.environ.get("FORCE_WEEK")
+def get_force_week(timezone: str = "America/Mexico_City") -> Optional[str]:
+    """Get forced week number (in the current ISO year) from environment variable."""
+    year = get_current_iso_year(timezone)
+    return _parse_force_week(os.environ.get("FORCE_WEEK"), year)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_force_week(force_week: Optional[str], year: int) -> Optional[str]:
+    """Convert a FORCE_WEEK value to a week string; cached per raw value."""
     if force_week:
         try:
             week_num = int(force_week)
-            return f"2025-W{week_num:02d}"
+            return f"{year}-W{week_num:02d}"
         except ValueError:
             return None
     return None
 
 
+def get_current_iso_year(timezone: str = "America/Mexico_City") -> int:
+    """
+    Get the ISO calendar year of today's date in the given timezone.
+
+    Use the same timezone as get_current_week_string so both agree around the
+    turn of an ISO year.
+    """
+    return _iso_year_for(datetime.now(ZoneInfo(timezone)).date())
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_year_for(day: date) -> int:
+    """Get the ISO year of a date; cached for the current day."""
+    return day.isocalendar()[0]
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory."""
     # Navigate from src/config.py to project root
     return Path(__file__).parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     """Get the data directory path."""
     return get_project_root() / "data"
 
 
-def get_schedule_path() -> Path:
-    """Get the schedule JSON file path."""
-    return get_data_dir() / "schedule_2025.json"
-
-
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
-    """Get the config JSON file path."""
-    return get_data_dir() / "config.json"
+    """Get the bot data JSON file path (config plus rotation schedule)."""
+    return get_data_dir() / "bot_data.json"
@@ -1,20 +1,65 @@
 """Rotation logic for determining who's responsible each week."""
 
-import json
-from datetime import datetime
+import functools
+import os
+import time
+from collections.abc import Iterator, Mapping
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
+from src.config import freeze, load_config
 
-def load_schedule_data(schedule_path: Path) -> dict:
-    """Load schedule data from JSON file."""
-    with open(schedule_path, encoding="utf-8") as f:
-        return json.load(f)  # type: ignore[no-any-return]
+
+@functools.lru_cache(maxsize=4)
+def _load_schedule_cached(path_str: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Build schedule data from the data file; cached per (path, mtime) pair."""
+    # Copy so the attached indexes don't leak into the cached config
+    schedule_data = _normalize_schedule(dict(load_config(Path(path_str))["rotation"]))
+    schedule_data["_rotation_index"] = _rotation_index(schedule_data)
+    schedule_data["_vacation_index"] = _vacation_index(schedule_data)
+    schedule_data["_rotation_table"] = build_rotation_table(schedule_data)
+    return freeze(schedule_data)  # type: ignore[no-any-return]
+
+
+def _normalize_schedule(schedule_data: dict[str, Any]) -> dict[str, Any]:
+    """Ensure the optional schedule sections exist so lookups can index them."""
+    schedule_data.setdefault("schedule_overrides", {})
+    schedule_data.setdefault("vacation_weeks", {})
+    schedule_data.setdefault("special_messages", {})
+    return schedule_data
+
+
+def load_schedule_data(data_path: Path) -> Mapping[str, Any]:
+    """
+    Load schedule data from the ``rotation`` section of the bot data file.
+
+    The file is parsed once through load_config, so loading both config and
+    schedule costs a single read. The result is cached until the file's mtime
+    changes and is returned deeply frozen, like load_config, so callers cannot
+    mutate the shared copy or leave the attached indexes stale. Missing
+    optional sections are filled with empty mappings, and lookup indexes and a
+    precomputed rotation table are attached under ``_rotation_index``,
+    ``_vacation_index`` and ``_rotation_table``.
+    """
+    mtime_ns = os.stat(data_path).st_mtime_ns
+    return _load_schedule_cached(str(data_path), mtime_ns)
 
 
 def get_current_week_string(timezone: str = "America/Mexico_City") -> str:
-    """Get the current ISO week string (e.g., '2025-W31')."""
+    """
+    Get the current ISO week string (e.g., '2025-W31').
+
+    The clock is read at most once per minute per timezone, so the result may
+    lag a week rollover by up to a minute.
+    """
+    return _week_for(int(time.monotonic() // 60), timezone)
+
+
+@functools.lru_cache(maxsize=1)
+def _week_for(minute_bucket: int, timezone: str) -> str:
+    """Read the clock for a minute bucket; cached until the bucket changes."""
     now = datetime.now(ZoneInfo(timezone))
     year, week, _ = now.isocalendar()
     return f"{year}-W{week:02d}"
@@ -22,56 +67,126 @@ def get_current_week_string(timezone: str = "America/Mexico_City") -> str:
 
 def get_week_number(week_string: str) -> int:
     """Extract week number from ISO week string."""
-    return int(week_string.split("-W")[1])
+    # Week strings are always "YYYY-Www"
+    return int(week_string[-2:])
 
 
+@functools.lru_cache(maxsize=256)
 def get_total_weeks_since_epoch(week_string: str) -> int:
     """Calculate total weeks since a fixed epoch for consistent ordering."""
-    year_str, week_str = week_string.split("-W")
-    year_int = int(year_str)
-    week_int = int(week_str)
-    # Use a simple formula: (year - 2000) * 52 + week
-    # This isn't perfect for leap weeks but good enough for rotation
-    return (year_int - 2000) * 52 + week_int
+    year_int = int(week_string[:4])
+    week_int = int(week_string[-2:])
+    # Ordinal of the week's Monday; Mondays are 7 days apart, so this counts
+    # weeks correctly across 53-week ISO years
+    return date.fromisocalendar(year_int, week_int, 1).toordinal() // 7
+
+
+def _rotation_index(schedule_data: Mapping[str, Any]) -> dict[str, int]:
+    """Map each name to its position in the default rotation."""
+    index = schedule_data.get("_rotation_index")
+    if index is not None:
+        return index  # type: ignore[no-any-return]
+
+    index = {}
+    for position, name in enumerate(schedule_data["default_rotation"]):
+        # Keep the first position for duplicated names, as list.index() did
+        index.setdefault(name, position)
+    return index
 
 
 def get_vacation_coverage(
-    person: str, week_string: str, schedule_data: dict
+    person: str, week_string: str, schedule_data: Mapping[str, Any]
 ) -> Optional[str]:
     """Find who covers for someone on vacation."""
     # Get the default rotation position of the person on vacation
-    rotation = schedule_data["default_rotation"]
-    if person not in rotation:
+    person_index = _rotation_index(schedule_data).get(person)
+    if person_index is None:
         return None
 
-    person_index = rotation.index(person)
+    rotation = schedule_data["default_rotation"]
     # Next person in rotation covers
     next_index = (person_index + 1) % len(rotation)
     return str(rotation[next_index])
 
 
+def _vacation_index(schedule_data: Mapping[str, Any]) -> dict[str, str]:
+    """Map each vacation week to the person covering it."""
+    index = schedule_data.get("_vacation_index")
+    if index is not None:
+        return index  # type: ignore[no-any-return]
+
+    index = {}
+    for person, vacation_weeks in schedule_data["vacation_weeks"].items():
+        for week_string in vacation_weeks:
+            # First listed person wins when several are away the same week
+            if week_string in index:
+                continue
+            coverage = get_vacation_coverage(person, week_string, schedule_data)
+            if coverage:
+                index[week_string] = coverage
+    return index
+
+
 def get_responsible_person(
-    week_string: str, schedule_data: dict
+    week_string: str, schedule_data: Mapping[str, Any]
 ) -> tuple[str, Optional[str]]:
     """
     Get responsible person for a given week.
 
     Returns tuple of (person_name, special_message)
     """
+    # Loaded schedules carry a precomputed table; fall back for other weeks
+    table = schedule_data.get("_rotation_table")
+    if table is not None and week_string in table:
+        return table[week_string]  # type: ignore[no-any-return]
+    return _compute_responsible_person(week_string, schedule_data)
+
+
+def _iter_iso_weeks(first_year: int, last_year: int) -> Iterator[str]:
+    """Yield every ISO week string from first_year to last_year inclusive."""
+    for year in range(first_year, last_year + 1):
+        # Dec 28th always falls in the last ISO week of its year
+        weeks_in_year = date(year, 12, 28).isocalendar()[1]
+        for week in range(1, weeks_in_year + 1):
+            yield f"{year}-W{week:02d}"
+
+
+def build_rotation_table(
+    schedule_data: Mapping[str, Any],
+    year_range: Optional[tuple[int, int]] = None,
+) -> dict[str, tuple[str, Optional[str]]]:
+    """
+    Precompute the responsible person for every ISO week in a year range.
+
+    ``year_range`` is inclusive and defaults to the start week's year plus the
+    two following years.
+    """
+    if year_range is None:
+        start_year = int(schedule_data["start_week"][:4])
+        year_range = (start_year, start_year + 2)
+
+    return {
+        week_string: _compute_responsible_person(week_string, schedule_data)
+        for week_string in _iter_iso_weeks(*year_range)
+    }
+
+
+def _compute_responsible_person(
+    week_string: str, schedule_data: Mapping[str, Any]
+) -> tuple[str, Optional[str]]:
+    """Resolve the responsible person for a week from the raw schedule data."""
     # Check for special messages
-    special_message = schedule_data.get("special_messages", {}).get(week_string)
+    special_message = schedule_data["special_messages"].get(week_string)
 
     # Check for vacation coverage
-    for person, vacation_weeks in schedule_data.get("vacation_weeks", {}).items():
-        if week_string in vacation_weeks:
-            # Find next person in rotation to cover
-            coverage = get_vacation_coverage(person, week_string, schedule_data)
-            if coverage:
-                return coverage, special_message
+    coverage = _vacation_index(schedule_data).get(week_string)
+    if coverage:
+        return coverage, special_message
 
     # Check explicit overrides
-    if week_string in schedule_data.get("schedule_overrides", {}):
-        return schedule_data["schedule_overrides"][week_string], special_message
+    override = schedule_data["schedule_overrides"].get(week_string)
+    if override is not None:
+        return str(override), special_message
 
     # Calculate from default rotation
     total_weeks = get_total_weeks_since_epoch(week_string)
@@ -81,7 +196,7 @@ def get_responsible_person(
     rotation = schedule_data["default_rotation"]
     rotation_index = weeks_since_start % len(rotation)
 
-    return rotation[rotation_index], special_message
+    return str(rotation[rotation_index]), special_message
 
 
 def format_message(
@@ -91,9 +206,5 @@ def format_message(
     week_number = get_week_number(week_string)
 
     # Use special message if available, otherwise use template
-    if special_message:
-        message = special_message.format(name=name, week=week_number)
-    else:
-        message = template.format(name=name, week=week_number)
-
-    return message
+    values = {"name": name, "week": week_number}
+    return (special_message or template).format_map(values)
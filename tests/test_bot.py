@@ -1,11 +1,89 @@
 """Unit tests for the main bot functionality."""
 
 import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-
-from src.bot import create_parser, main, send_message
+from telegram import Bot
+from telegram.error import BadRequest, RetryAfter, TimedOut
+
+from src.bot import (
+    MAX_RETRY_AFTER_SECONDS,
+    MAX_SEND_ATTEMPTS,
+    NETWORK_BACKOFF_SECONDS,
+    RateLimitedSender,
+    _get_bot,
+    create_parser,
+    main,
+    pack_lines,
+    send_message,
+    send_messages,
+)
+from src.rotation import get_responsible_person
+
+
+@pytest.fixture(autouse=True)
+def clear_bot_cache():
+    """Keep bots created under a patched Bot class out of other tests."""
+    _get_bot.cache_clear()
+    yield
+    _get_bot.cache_clear()
+
+
+class FakeTelegramHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive Bot API endpoint for getMe and sendMessage."""
+
+    protocol_version = "HTTP/1.1"
+    results = {
+        "getMe": {"id": 1, "is_bot": True, "first_name": "Test", "username": "t_bot"},
+        "sendMessage": {
+            "message_id": 1,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+            "text": "ok",
+        },
+    }
+
+    def do_POST(self):  # noqa: N802 - BaseHTTPRequestHandler API
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        method = self.path.rsplit("/", 1)[-1]
+        self.server.calls.append(method)
+        if self.server.failures:
+            # Drop the connection without a response to simulate a network error
+            self.server.failures -= 1
+            self.close_connection = True
+            return
+        body = json.dumps({"ok": True, "result": self.results[method]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def telegram_server():
+    """Run a fake Bot API server on localhost for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTelegramHandler)
+    server.calls = []
+    server.failures = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
 
 
 class TestSendMessage:
@@ -34,6 +112,77 @@ class TestSendMessage:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_send_message_retry_after(self):
+        """Test flood control waits for the requested delay and retries."""
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = [RetryAfter(3), MagicMock()]
+
+        with patch("src.bot.asyncio.sleep") as mock_sleep:
+            result = await send_message(mock_bot, "12345", "Test message")
+
+        assert result is True
+        assert mock_bot.send_message.call_count == 2
+        mock_sleep.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_send_message_network_backoff(self):
+        """Test network errors back off exponentially and give up."""
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = TimedOut()
+
+        with patch("src.bot.asyncio.sleep") as mock_sleep:
+            result = await send_message(mock_bot, "12345", "Test message")
+
+        assert result is False
+        assert mock_bot.send_message.call_count == 3
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_send_message_no_retry_log_on_last_attempt(self, caplog):
+        """Test only attempts that are actually retried log a retry."""
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = TimedOut()
+
+        with patch("src.bot.asyncio.sleep"):
+            await send_message(mock_bot, "12345", "Test message")
+
+        retry_logs = [r for r in caplog.records if "retry in" in r.getMessage()]
+        assert len(retry_logs) == MAX_SEND_ATTEMPTS - 1
+        assert f"after {MAX_SEND_ATTEMPTS} attempts" in caplog.records[-1].getMessage()
+
+    @pytest.mark.asyncio
+    async def test_send_message_retry_after_too_long(self):
+        """Test flood-control waits beyond the cap give up instead of sleeping."""
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = RetryAfter(int(MAX_RETRY_AFTER_SECONDS) + 1)
+
+        with patch("src.bot.asyncio.sleep") as mock_sleep:
+            result = await send_message(mock_bot, "12345", "Test message")
+
+        assert result is False
+        mock_bot.send_message.assert_called_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_message_telegram_error_not_retried(self):
+        """Test non-transient Telegram errors fail without retrying."""
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = BadRequest("Chat not found")
+
+        with patch("src.bot.asyncio.sleep") as mock_sleep:
+            result = await send_message(mock_bot, "12345", "Test message")
+
+        assert result is False
+        mock_bot.send_message.assert_called_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_message_requires_bot(self):
+        """Test a real send without a bot is rejected."""
+        with pytest.raises(ValueError, match="bot is required"):
+            await send_message(None, "12345", "Test message")
+
     @pytest.mark.asyncio
     async def test_send_message_dry_run(self):
         """Test dry run mode doesn't send actual message."""
@@ -45,6 +194,154 @@ class TestSendMessage:
         mock_bot.send_message.assert_not_called()
 
 
+class TestLazyImports:
+    """Test the telegram stack is only imported when needed."""
+
+    def test_import_does_not_load_telegram(self):
+        """Test importing the bot module leaves telegram unloaded."""
+        code = "import sys, src.bot; print('telegram' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+
+class TestSendMessages:
+    """Test batching several lines into few messages."""
+
+    def test_pack_lines_joins_under_limit(self):
+        """Test lines that fit are joined into one chunk."""
+        assert pack_lines(["a", "bb", "ccc"], max_len=10) == ["a\nbb\nccc"]
+
+    def test_pack_lines_splits_at_limit(self):
+        """Test chunks never exceed the limit, counting newlines."""
+        chunks = pack_lines(["aaaa", "bbbb", "cccc"], max_len=9)
+        assert chunks == ["aaaa\nbbbb", "cccc"]
+        assert all(len(chunk) <= 9 for chunk in chunks)
+
+    def test_pack_lines_splits_long_line(self):
+        """Test a line longer than the limit is split, preserving order."""
+        chunks = pack_lines(["x", "abcdefg", "y"], max_len=3)
+        assert chunks == ["x", "abc", "def", "g\ny"]
+
+    def test_pack_lines_rejects_non_positive_limit(self):
+        """Test a limit below one is rejected instead of looping forever."""
+        with pytest.raises(ValueError, match="max_len"):
+            pack_lines(["a"], max_len=0)
+
+    def test_pack_lines_empty(self):
+        """Test no lines produce no chunks."""
+        assert pack_lines([]) == []
+
+    @pytest.mark.asyncio
+    async def test_send_messages_batches(self):
+        """Test lines are sent as packed chunks."""
+        mock_bot = AsyncMock()
+
+        result = await send_messages(mock_bot, "12345", ["one", "two"])
+
+        assert result is True
+        mock_bot.send_message.assert_called_once_with(chat_id="12345", text="one\ntwo")
+
+    @pytest.mark.asyncio
+    async def test_send_messages_dry_run_without_bot(self):
+        """Test dry runs need no bot."""
+        assert await send_messages(None, "12345", ["one"], dry_run=True) is True
+
+    @pytest.mark.asyncio
+    async def test_send_messages_failure(self):
+        """Test a failed chunk makes the whole send fail."""
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = [MagicMock(), Exception("Network error")]
+
+        result = await send_messages(mock_bot, "12345", ["aaaa", "bbbb"], max_len=5)
+
+        assert result is False
+        assert mock_bot.send_message.call_count == 2
+
+
+class TestRateLimitedSender:
+    """Test queued, rate-limited message delivery."""
+
+    @pytest.mark.asyncio
+    async def test_send_delivers_message(self):
+        """Test a queued message is delivered through the bot."""
+        mock_bot = AsyncMock()
+
+        async with RateLimitedSender(mock_bot) as sender:
+            result = await sender.send("12345", "Test message")
+
+        assert result is True
+        mock_bot.send_message.assert_called_once_with(
+            chat_id="12345", text="Test message"
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_reports_failure(self):
+        """Test a failed delivery is reported to the caller."""
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = Exception("Network error")
+
+        async with RateLimitedSender(mock_bot) as sender:
+            result = await sender.send("12345", "Test message")
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_send_starts_worker_lazily(self):
+        """Test send works without start() and again after close()."""
+        mock_bot = AsyncMock()
+        sender = RateLimitedSender(mock_bot)
+
+        assert await asyncio.wait_for(sender.send("12345", "First"), 1) is True
+        await sender.close()
+        assert await asyncio.wait_for(sender.send("12345", "Second"), 1) is True
+        await sender.close()
+
+        assert mock_bot.send_message.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_respects_rate(self):
+        """Test sends beyond the rate wait for the next period."""
+        loop = asyncio.get_running_loop()
+        sent_at = []
+        mock_bot = AsyncMock()
+        mock_bot.send_message.side_effect = lambda **_: sent_at.append(loop.time())
+
+        start = loop.time()
+        async with RateLimitedSender(mock_bot, rate=2, period=0.2) as sender:
+            results = await asyncio.gather(
+                *(sender.send("12345", f"Message {i}") for i in range(3))
+            )
+
+        assert results == [True, True, True]
+        assert sent_at == sorted(sent_at)
+        # The third send needs a token that is only returned one period later
+        assert sent_at[2] - start >= 0.2
+
+
+class TestGetBot:
+    """Test bot instance reuse."""
+
+    def test_get_bot_reuses_instance(self):
+        """Test the same token returns the same bot."""
+        with patch("telegram.Bot") as MockBot:
+            assert _get_bot("test-token") is _get_bot("test-token")
+            MockBot.assert_called_once_with(token="test-token")
+
+    def test_get_bot_new_token(self):
+        """Test a different token builds a new bot."""
+        with patch("telegram.Bot") as MockBot:
+            _get_bot("token-a")
+            _get_bot("token-b")
+            assert MockBot.call_count == 2
+
+
 class TestMainFunction:
     """Test the main bot function."""
 
@@ -78,7 +375,7 @@ class TestMainFunction:
             patch("src.bot.get_bot_token", return_value="test-token"),
             patch("src.bot.get_chat_id", return_value="test-chat"),
             patch("src.bot.get_current_week_string", return_value="2025-W31"),
-            patch("src.bot.Bot") as MockBot,
+            patch("telegram.Bot") as MockBot,
             patch("src.bot.send_message", return_value=True) as mock_send,
         ):
             result = await main(args)
@@ -87,6 +384,56 @@ class TestMainFunction:
             MockBot.assert_called_once_with(token="test-token")
             mock_send.assert_called_once()
 
+    def test_main_reuses_bot_across_event_loops(
+        self, mock_config, mock_schedule, telegram_server
+    ):
+        """Test the cached bot works in a second asyncio.run without retrying."""
+        args = argparse.Namespace(dry_run=False, test_week=None, test=False)
+        base_url = f"http://127.0.0.1:{telegram_server.server_port}/bot"
+
+        with (
+            patch("src.bot.load_config", return_value=mock_config),
+            patch("src.bot.load_schedule_data", return_value=mock_schedule),
+            patch("src.bot.get_bot_token", return_value="test-token"),
+            patch("src.bot.get_chat_id", return_value="test-chat"),
+            patch("src.bot.get_current_week_string", return_value="2025-W31"),
+            patch(
+                "telegram.Bot",
+                side_effect=lambda token: Bot(token=token, base_url=base_url),
+            ) as MockBot,
+            patch("src.bot.asyncio.sleep", side_effect=AssertionError("retried")),
+        ):
+            assert asyncio.run(main(args)) == 0
+            assert asyncio.run(main(args)) == 0
+
+        MockBot.assert_called_once()
+        assert telegram_server.calls == ["sendMessage"] * 2
+
+    def test_main_retries_transient_error_on_first_call(
+        self, mock_config, mock_schedule, telegram_server
+    ):
+        """Test a network error on the run's first HTTP call is retried."""
+        args = argparse.Namespace(dry_run=False, test_week=None, test=False)
+        base_url = f"http://127.0.0.1:{telegram_server.server_port}/bot"
+        telegram_server.failures = 1
+
+        with (
+            patch("src.bot.load_config", return_value=mock_config),
+            patch("src.bot.load_schedule_data", return_value=mock_schedule),
+            patch("src.bot.get_bot_token", return_value="test-token"),
+            patch("src.bot.get_chat_id", return_value="test-chat"),
+            patch("src.bot.get_current_week_string", return_value="2025-W31"),
+            patch(
+                "telegram.Bot",
+                side_effect=lambda token: Bot(token=token, base_url=base_url),
+            ),
+            patch("src.bot.asyncio.sleep") as mock_sleep,
+        ):
+            assert asyncio.run(main(args)) == 0
+
+        mock_sleep.assert_awaited_once_with(NETWORK_BACKOFF_SECONDS)
+        assert telegram_server.calls == ["sendMessage"] * 2
+
     @pytest.mark.asyncio
     async def test_main_dry_run(self, mock_config, mock_schedule):
         """Test main execution in dry run mode."""
@@ -96,12 +443,16 @@ class TestMainFunction:
             patch("src.bot.load_config", return_value=mock_config),
             patch("src.bot.load_schedule_data", return_value=mock_schedule),
             patch("src.bot.get_current_week_string", return_value="2025-W31"),
-            patch("src.bot.Bot") as MockBot,
+            patch("telegram.Bot") as MockBot,
+            patch("src.bot.send_message", return_value=True) as mock_send,
         ):
             result = await main(args)
 
             assert result == 0
             MockBot.assert_not_called()  # No bot created in dry run
+            mock_send.assert_called_once_with(
+                None, "TEST_CHAT_ID", "Week 31: Esteban is responsible!", dry_run=True
+            )
 
     @pytest.mark.asyncio
     async def test_main_with_test_week(self, mock_config, mock_schedule):
@@ -111,6 +462,7 @@ class TestMainFunction:
         with (
             patch("src.bot.load_config", return_value=mock_config),
             patch("src.bot.load_schedule_data", return_value=mock_schedule),
+            patch("src.bot.get_current_iso_year", return_value=2025) as mock_year,
             patch(
                 "src.bot.get_responsible_person", return_value=("TestPerson", None)
             ) as mock_responsible,
@@ -118,6 +470,7 @@ class TestMainFunction:
             result = await main(args)
 
             assert result == 0
+            mock_year.assert_called_once_with("America/Mexico_City")
             mock_responsible.assert_called_with("2025-W42", mock_schedule)
 
     @pytest.mark.asyncio
@@ -138,6 +491,33 @@ class TestMainFunction:
             assert result == 0
             mock_responsible.assert_called_with("2025-W35", mock_schedule)
 
+    @pytest.mark.asyncio
+    async def test_main_force_week_at_iso_year_boundary(
+        self, mock_config, mock_schedule
+    ):
+        """Test FORCE_WEEK uses the configured timezone's ISO year."""
+        args = argparse.Namespace(dry_run=True, test_week=None, test=False)
+
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                # Still 2026-W53 in Mexico City, already 2027-W01 in UTC
+                return datetime(2027, 1, 4, 2, 0, tzinfo=timezone.utc).astimezone(tz)
+
+        with (
+            patch.dict(os.environ, {"FORCE_WEEK": "53"}),
+            patch("src.config.datetime", FixedDatetime),
+            patch("src.bot.load_config", return_value=mock_config),
+            patch("src.bot.load_schedule_data", return_value=mock_schedule),
+            patch(
+                "src.bot.get_responsible_person", wraps=get_responsible_person
+            ) as mock_responsible,
+        ):
+            result = await main(args)
+
+            assert result == 0
+            mock_responsible.assert_called_with("2026-W53", mock_schedule)
+
     @pytest.mark.asyncio
     async def test_main_with_test_message(self, mock_config, mock_schedule):
         """Test main execution with test message override."""
@@ -1,20 +1,24 @@
 """Unit tests for configuration management."""
 
+import importlib
 import json
 import os
-from pathlib import Path
-from unittest.mock import mock_open, patch
+import sys
+from datetime import datetime, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 import pytest
 
+import src.config
 from src.config import (
     get_bot_token,
     get_chat_id,
     get_config_path,
+    get_current_iso_year,
     get_data_dir,
     get_force_week,
     get_project_root,
-    get_schedule_path,
     get_test_message,
     load_config,
 )
@@ -23,22 +27,86 @@ from src.config import (
 class TestConfigLoading:
     """Test configuration file loading."""
 
-    def test_load_config_valid_json(self):
+    def test_load_config_valid_json(self, tmp_path):
         """Test loading valid JSON configuration."""
-        mock_json = json.dumps(
-            {"timezone": "America/Mexico_City", "message_template": "Hello {name}!"}
+        config_path = tmp_path / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {"timezone": "America/Mexico_City", "message_template": "Hello {name}!"}
+            ),
+            encoding="utf-8",
         )
 
-        with patch("builtins.open", mock_open(read_data=mock_json)):
-            config = load_config(Path("mock_config.json"))
-            assert config["timezone"] == "America/Mexico_City"
-            assert config["message_template"] == "Hello {name}!"
+        config = load_config(config_path)
+        assert config["timezone"] == "America/Mexico_City"
+        assert config["message_template"] == "Hello {name}!"
 
-    def test_load_config_invalid_json(self):
+    def test_load_config_invalid_json(self, tmp_path):
         """Test loading invalid JSON raises error."""
-        with patch("builtins.open", mock_open(read_data="{ invalid json")):
-            with pytest.raises(json.JSONDecodeError):
-                load_config(Path("mock_config.json"))
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{ invalid json", encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_config(config_path)
+
+    def test_load_config_is_cached(self, tmp_path):
+        """Test repeated loads of an unchanged file reuse the parsed result."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"timezone": "UTC"}', encoding="utf-8")
+
+        assert load_config(config_path) is load_config(config_path)
+
+    def test_load_config_reloads_after_change(self, tmp_path):
+        """Test a modified file is parsed again."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"timezone": "UTC"}', encoding="utf-8")
+        assert load_config(config_path)["timezone"] == "UTC"
+
+        config_path.write_text('{"timezone": "Europe/Madrid"}', encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(config_path)["timezone"] == "Europe/Madrid"
+
+    def test_load_config_is_deeply_read_only(self, tmp_path):
+        """Test nested objects and arrays in the cached config are frozen too."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(
+            '{"schedule": {"days": ["Sunday"], "time": "09:00"}}', encoding="utf-8"
+        )
+
+        config = load_config(config_path)
+        with pytest.raises(TypeError):
+            config["schedule"]["time"] = "10:00"
+        with pytest.raises(AttributeError):
+            config["schedule"]["days"].append("Monday")
+        assert load_config(config_path)["schedule"]["days"] == ("Sunday",)
+
+    def test_load_config_is_read_only(self, tmp_path):
+        """Test the cached config cannot be mutated by callers."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"timezone": "UTC"}', encoding="utf-8")
+
+        config = load_config(config_path)
+        with pytest.raises(TypeError):
+            config["timezone"] = "Europe/Madrid"  # type: ignore[index]
+
+
+class TestJsonBackend:
+    """Test the JSON parser selection."""
+
+    def test_falls_back_to_stdlib_json(self, tmp_path):
+        """Test config loading works when orjson is not installed."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"timezone": "UTC"}', encoding="utf-8")
+
+        try:
+            with patch.dict(sys.modules, {"orjson": None}):
+                module = importlib.reload(src.config)
+                assert module._json_loads is json.loads
+                assert module.load_config(config_path)["timezone"] == "UTC"
+        finally:
+            importlib.reload(src.config)
 
 
 class TestEnvironmentVariables:
@@ -78,12 +146,18 @@ class TestEnvironmentVariables:
 
     def test_get_force_week_valid(self):
         """Test forcing a specific week number."""
-        with patch.dict(os.environ, {"FORCE_WEEK": "42"}):
+        with (
+            patch.dict(os.environ, {"FORCE_WEEK": "42"}),
+            patch("src.config.get_current_iso_year", return_value=2025),
+        ):
             assert get_force_week() == "2025-W42"
 
     def test_get_force_week_with_padding(self):
         """Test force week with single digit gets padded."""
-        with patch.dict(os.environ, {"FORCE_WEEK": "5"}):
+        with (
+            patch.dict(os.environ, {"FORCE_WEEK": "5"}),
+            patch("src.config.get_current_iso_year", return_value=2025),
+        ):
             assert get_force_week() == "2025-W05"
 
     def test_get_force_week_invalid(self):
@@ -96,6 +170,64 @@ class TestEnvironmentVariables:
         with patch.dict(os.environ, {}, clear=True):
             assert get_force_week() is None
 
+    def test_get_force_week_tracks_environment(self):
+        """Test cached parsing still follows changes to FORCE_WEEK."""
+        with patch("src.config.get_current_iso_year", return_value=2025):
+            with patch.dict(os.environ, {"FORCE_WEEK": "10"}):
+                assert get_force_week() == "2025-W10"
+            with patch.dict(os.environ, {"FORCE_WEEK": "11"}):
+                assert get_force_week() == "2025-W11"
+            with patch.dict(os.environ, {}, clear=True):
+                assert get_force_week() is None
+
+    def test_get_force_week_uses_current_year(self):
+        """Test forced weeks follow the current ISO year."""
+        with (
+            patch.dict(os.environ, {"FORCE_WEEK": "7"}),
+            patch("src.config.datetime") as mock_datetime,
+        ):
+            mock_datetime.now.return_value = datetime(2026, 3, 1)
+            assert get_force_week() == "2026-W07"
+
+
+class FixedDatetime(datetime):
+    """datetime whose now() is pinned to 2027-01-04 02:00 UTC."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2027, 1, 4, 2, 0, tzinfo=timezone.utc).astimezone(tz)
+
+
+class TestCurrentIsoYear:
+    """Test current ISO year derivation."""
+
+    def test_get_current_iso_year(self):
+        """Test the ISO year of a mid-year date."""
+        with patch("src.config.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 6, 15)
+            assert get_current_iso_year() == 2026
+
+    def test_get_current_iso_year_uses_timezone(self):
+        """Test the clock is read in the requested timezone."""
+        with patch("src.config.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 6, 15)
+            get_current_iso_year("Europe/Madrid")
+            mock_datetime.now.assert_called_once_with(ZoneInfo("Europe/Madrid"))
+
+    def test_get_current_iso_year_timezone_boundary(self):
+        """Test the ISO year follows the timezone, not the host clock."""
+        with patch("src.config.datetime", FixedDatetime):
+            # 2027-01-04 02:00 UTC is still Sunday 2027-01-03 (2026-W53) in Mexico
+            assert get_current_iso_year("America/Mexico_City") == 2026
+            assert get_current_iso_year("UTC") == 2027
+
+    def test_get_current_iso_year_boundary(self):
+        """Test early January can still belong to the previous ISO year."""
+        with patch("src.config.datetime") as mock_datetime:
+            # 2027-01-01 falls in ISO week 2026-W53
+            mock_datetime.now.return_value = datetime(2027, 1, 1)
+            assert get_current_iso_year() == 2026
+
 
 class TestPathHelpers:
     """Test path helper functions."""
@@ -113,28 +245,25 @@ class TestPathHelpers:
         assert data_dir.name == "data"
         assert data_dir.parent == get_project_root()
 
-    def test_get_schedule_path(self):
-        """Test schedule file path."""
-        schedule_path = get_schedule_path()
-        assert schedule_path.name == "schedule_2025.json"
-        assert schedule_path.parent == get_data_dir()
-
     def test_get_config_path(self):
         """Test config file path."""
         config_path = get_config_path()
-        assert config_path.name == "config.json"
+        assert config_path.name == "bot_data.json"
         assert config_path.parent == get_data_dir()
 
+    def test_paths_are_cached(self):
+        """Test path helpers return the same object on repeated calls."""
+        assert get_project_root() is get_project_root()
+        assert get_config_path() is get_config_path()
+
     def test_paths_are_consistent(self):
         """Test that all paths are consistent with each other."""
         root = get_project_root()
         data = get_data_dir()
-        schedule = get_schedule_path()
         config = get_config_path()
 
         assert data == root / "data"
-        assert schedule == data / "schedule_2025.json"
-        assert config == data / "config.json"
+        assert config == data / "bot_data.json"
 
 
 class TestIntegration:
@@ -151,7 +280,8 @@ class TestIntegration:
         assert "message_template" in config
         assert "schedule" in config
 
-    def test_actual_schedule_file_exists(self):
-        """Test that actual schedule file exists."""
-        schedule_path = get_schedule_path()
-        assert schedule_path.exists(), f"Schedule file not found at {schedule_path}"
+    def test_actual_config_has_rotation(self):
+        """Test that the actual data file embeds the rotation schedule."""
+        rotation = load_config(get_config_path())["rotation"]
+        assert "default_rotation" in rotation
+        assert "start_week" in rotation
@@ -1,12 +1,22 @@
 """Unit tests for rotation logic."""
 
+import json
+import re
+from datetime import datetime
+from unittest.mock import patch
+
 import pytest
 
+from src.config import load_config
 from src.rotation import (
+    _week_for,
+    build_rotation_table,
     format_message,
+    get_current_week_string,
     get_responsible_person,
     get_vacation_coverage,
     get_week_number,
+    load_schedule_data,
 )
 
 
@@ -24,6 +34,102 @@ class TestRotationBasics:
         assert get_week_number("2025-W09") == 9
         assert get_week_number("2025-W10") == 10
 
+    def test_get_current_week_string_format(self):
+        """Test current week string uses the ISO week format."""
+        assert re.fullmatch(r"\d{4}-W\d{2}", get_current_week_string())
+        assert re.fullmatch(r"\d{4}-W\d{2}", get_current_week_string("UTC"))
+
+    def test_get_current_week_string_reads_clock_once_per_minute(self):
+        """Test the clock is only read again once the minute changes."""
+        _week_for.cache_clear()
+        with (
+            patch("src.rotation.time") as mock_time,
+            patch("src.rotation.datetime") as mock_datetime,
+        ):
+            mock_time.monotonic.return_value = 600.0
+            mock_datetime.now.return_value = datetime(2026, 1, 5)
+            assert get_current_week_string("UTC") == "2026-W02"
+            assert get_current_week_string("UTC") == "2026-W02"
+            assert mock_datetime.now.call_count == 1
+
+            mock_time.monotonic.return_value = 660.0
+            mock_datetime.now.return_value = datetime(2026, 1, 12)
+            assert get_current_week_string("UTC") == "2026-W03"
+        _week_for.cache_clear()
+
+
+def write_bot_data(tmp_path, rotation):
+    """Write a bot data file with the given rotation section."""
+    data_path = tmp_path / "bot_data.json"
+    data_path.write_text(
+        json.dumps({"timezone": "UTC", "rotation": rotation}), encoding="utf-8"
+    )
+    return data_path
+
+
+class TestScheduleLoading:
+    """Test schedule loading from the bot data file."""
+
+    def test_load_schedule_data_is_cached(self, tmp_path):
+        """Test repeated loads of an unchanged file reuse the parsed result."""
+        data_path = write_bot_data(
+            tmp_path, {"default_rotation": ["A", "B"], "start_week": "2025-W01"}
+        )
+
+        schedule = load_schedule_data(data_path)
+        assert schedule["default_rotation"] == ("A", "B")
+        assert load_schedule_data(data_path) is schedule
+
+    def test_load_schedule_data_is_read_only(self, tmp_path):
+        """Test the cached schedule cannot be mutated by callers."""
+        data_path = write_bot_data(
+            tmp_path, {"default_rotation": ["A", "B"], "start_week": "2025-W01"}
+        )
+
+        schedule = load_schedule_data(data_path)
+        with pytest.raises(TypeError):
+            schedule["start_week"] = "2025-W02"  # type: ignore[index]
+
+    def test_load_schedule_data_is_deeply_read_only(self, tmp_path):
+        """Test nested sections and precomputed indexes cannot be mutated."""
+        data_path = write_bot_data(
+            tmp_path,
+            {
+                "default_rotation": ["A", "B"],
+                "start_week": "2025-W01",
+                "schedule_overrides": {"2025-W03": "B"},
+            },
+        )
+
+        schedule = load_schedule_data(data_path)
+        with pytest.raises(TypeError):
+            schedule["schedule_overrides"]["2025-W03"] = "A"
+        with pytest.raises(AttributeError):
+            schedule["default_rotation"].append("C")
+        with pytest.raises(TypeError):
+            schedule["_rotation_table"]["2025-W03"] = ("A", None)
+        assert get_responsible_person("2025-W03", schedule) == ("B", None)
+
+    def test_load_schedule_data_fills_optional_sections(self, tmp_path):
+        """Test missing optional sections are loaded as empty dicts."""
+        data_path = write_bot_data(
+            tmp_path, {"default_rotation": ["A", "B"], "start_week": "2025-W01"}
+        )
+
+        schedule = load_schedule_data(data_path)
+        assert schedule["schedule_overrides"] == {}
+        assert schedule["vacation_weeks"] == {}
+        assert schedule["special_messages"] == {}
+
+    def test_load_schedule_data_leaves_config_untouched(self, tmp_path):
+        """Test attached indexes don't leak into the config's rotation section."""
+        data_path = write_bot_data(
+            tmp_path, {"default_rotation": ["A", "B"], "start_week": "2025-W01"}
+        )
+
+        load_schedule_data(data_path)
+        assert "_rotation_table" not in load_config(data_path)["rotation"]
+
 
 class TestRotationLogic:
     """Test the core rotation logic."""
@@ -86,6 +192,18 @@ class TestRotationLogic:
         person, _ = get_responsible_person("2025-W40", schedule_with_overrides)
         assert person == "Chito"  # Next person after Adrian
 
+    def test_vacation_first_listed_person_wins(self):
+        """Test overlapping vacations resolve to the first listed person."""
+        schedule = {
+            "default_rotation": ["A", "B", "C", "D"],
+            "start_week": "2025-W01",
+            "schedule_overrides": {},
+            "vacation_weeks": {"C": ["2025-W10"], "A": ["2025-W10"]},
+            "special_messages": {},
+        }
+        person, _ = get_responsible_person("2025-W10", schedule)
+        assert person == "D"  # C is listed first, D covers for C
+
     def test_special_messages(self, schedule_with_overrides):
         """Test special message handling."""
         person, special_msg = get_responsible_person(
@@ -93,6 +211,41 @@ class TestRotationLogic:
         )
         assert special_msg == "🎄 Holiday week: {name} is responsible!"
 
+    def test_rotation_table_matches_lookup(self, schedule_with_overrides):
+        """Test the precomputed table agrees with direct resolution."""
+        table = build_rotation_table(schedule_with_overrides)
+        assert "2025-W01" in table
+        assert "2027-W52" in table
+        for week_string in ("2025-W32", "2025-W34", "2025-W40", "2025-W52"):
+            assert table[week_string] == get_responsible_person(
+                week_string, schedule_with_overrides
+            )
+
+    def test_rotation_table_year_range(self, basic_schedule):
+        """Test the table covers exactly the requested years."""
+        table = build_rotation_table(basic_schedule, year_range=(2026, 2026))
+        assert "2025-W52" not in table
+        assert "2026-W53" in table  # 2026 has 53 ISO weeks
+        assert "2027-W01" not in table
+
+    def test_loaded_schedule_uses_table(self, tmp_path):
+        """Test loaded schedules answer from the precomputed table."""
+        data_path = write_bot_data(
+            tmp_path,
+            {
+                "default_rotation": ["A", "B"],
+                "start_week": "2025-W01",
+                "schedule_overrides": {"2025-W03": "B"},
+            },
+        )
+
+        schedule = load_schedule_data(data_path)
+        assert schedule["_rotation_index"] == {"A": 0, "B": 1}
+        assert schedule["_rotation_table"]["2025-W03"] == ("B", None)
+        assert get_responsible_person("2025-W03", schedule) == ("B", None)
+        # Weeks outside the table are still resolved
+        assert get_responsible_person("2030-W01", schedule)[0] in ("A", "B")
+
     def test_get_vacation_coverage_function(self):
         """Test the vacation coverage helper function."""
         schedule = {"default_rotation": ["A", "B", "C", "D"]}
@@ -147,10 +300,10 @@ class TestEdgeCases:
             "special_messages": {},
         }
         # 2027-W01 compared to 2025-W01:
-        # This is exactly 104 weeks later (2 years * 52 weeks)
-        # 104 % 3 = 2, so index 2 = "C"
+        # 2025 has 52 ISO weeks and 2026 has 53, so this is 105 weeks later
+        # 105 % 3 = 0, so index 0 = "A"
         person, _ = get_responsible_person("2027-W01", schedule)
-        assert person == "C"
+        assert person == "A"
 
     def test_past_weeks(self):
         """Test handling of past weeks."""
@@ -178,3 +331,16 @@ class TestEdgeCases:
         assert get_responsible_person("2025-W52", schedule)[0] == "A"
         assert get_responsible_person("2026-W01", schedule)[0] == "B"
         assert get_responsible_person("2026-W02", schedule)[0] == "A"
+
+    def test_53_week_year(self):
+        """Test ISO week 53 is its own rotation slot."""
+        schedule = {
+            "default_rotation": ["A", "B"],
+            "start_week": "2026-W52",
+            "schedule_overrides": {},
+            "vacation_weeks": {},
+            "special_messages": {},
+        }
+        assert get_responsible_person("2026-W52", schedule)[0] == "A"
+        assert get_responsible_person("2026-W53", schedule)[0] == "B"
+        assert get_responsible_person("2027-W01", schedule)[0] == "A"